@@ -4,17 +4,32 @@ This module exposes endpoints to create and read users and loans, compute loan
 schedules, and summarize loan balances. Financial math uses Decimal with
 cent-level rounding for accuracy.
 """
-from typing import List
-
-from fastapi import FastAPI, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from functools import lru_cache
+from itertools import islice
+from typing import List, Optional
+
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import exists, inspect, lambda_stmt, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only, raiseload
 from decimal import Decimal, ROUND_HALF_UP, getcontext
+from logging.handlers import QueueHandler, QueueListener
+import atexit
 import logging
+import queue
+import warnings
+
+import orjson
 
 from . import models, schemas
 from .database import engine, get_db
 
-# Configure module logger.
+# Configure module logger. Records go through a queue to a background
+# listener so stream writes never block the request-serving thread.
 logger = logging.getLogger("loan_amori")
 if not logger.handlers:
     handler = logging.StreamHandler()
@@ -22,23 +37,102 @@ if not logger.handlers:
         fmt="%(asctime)s %(levelname)s %(name)s - %(message)s",
     )
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(log_queue, handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    logger.addHandler(QueueHandler(log_queue))
 logger.setLevel(logging.INFO)
 
 # Create tables on startup (simple dev setup).
 models.Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Loan Amori API")
+
+def _upgrade_existing_schema(bind) -> None:
+    """Bring a database created by an older version up to the current models.
+
+    create_all never alters existing tables. Databases created before
+    loans.monthly_payment existed get the column here. Their rows keep NULL,
+    and _loan_monthly_payment computes the payment on read. Indexes added since
+    (ix_loans_user_id, ix_loan_shares_user_id) are created if missing.
+    """
+    columns = {column["name"] for column in inspect(bind).get_columns("loans")}
+    if "monthly_payment" not in columns:
+        with bind.begin() as conn:
+            conn.execute(text("ALTER TABLE loans ADD COLUMN monthly_payment NUMERIC(14, 2)"))
+    for table in models.Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind, checkfirst=True)
+
+
+_upgrade_existing_schema(engine)
+
+app = FastAPI(title="Loan Amori API", default_response_class=ORJSONResponse)
+# Long schedules are hundreds of near-identical rows; small bodies pass through.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
+
+@app.exception_handler(RequestValidationError)
+async def request_validation_error_handler(request: Request, exc: RequestValidationError):
+    """Return 422 like FastAPI's default, encoded with orjson.
+
+    Errors echo the rejected input, and the stdlib encoder behind the default
+    handler fails on inf/nan; orjson writes them as null.
+    """
+    return ORJSONResponse(status_code=422, content={"detail": jsonable_encoder(exc.errors())})
+
+# Keyset pagination bounds for the list endpoints.
+_DEFAULT_PAGE_SIZE = 100
+_MAX_PAGE_SIZE = 1000
+
+# Columns needed to build UserRead / LoanRead responses for list endpoints.
+_USER_READ_COLUMNS = load_only(models.User.id, models.User.username, models.User.email)
+_LOAN_READ_COLUMNS = load_only(
+    models.Loan.id,
+    models.Loan.user_id,
+    models.Loan.amount,
+    models.Loan.annual_interest_rate,
+    models.Loan.loan_term_in_months,
+)
+# Loan endpoints only read scalar columns (shared ids come straight from the
+# association table), so any relationship load would be an accidental extra
+# query, per row on list endpoints; fail loudly instead.
+_NO_RELATIONSHIP_LOADS = raiseload("*")
 
 # Use high precision for intermediate Decimal math.
 getcontext().prec = 28
 
+# Decimal constants used by the hot amortization paths, parsed once.
+_ONE = Decimal("1")
+_HUNDRED = Decimal("100")
+_TWELVE = Decimal("12")
+_CENTS = Decimal("0.01")
+_ZERO_CENTS = Decimal("0.00")
+# Scale of the Numeric(18, 6) Loan.amount and Loan.annual_interest_rate columns.
+_LOAN_INPUT_SCALE = Decimal("0.000001")
+
+# The amortization helpers below are pure and memoized. Endpoints normalize
+# loan inputs the same way (Numeric column value, rate / 100 / 12), so
+# identical loans map to identical cache keys.
+
 
 def _to_cents(value: Decimal) -> Decimal:
     """Return value rounded to cents using ROUND_HALF_UP."""
-    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return value.quantize(_CENTS, rounding=ROUND_HALF_UP)
+
+
+@lru_cache(maxsize=4096)
+def _amortization_factor(monthly_rate: Decimal, term_months: int) -> Decimal:
+    """Return r (1+r)^n / ((1+r)^n - 1), the payment per unit of principal.
+
+    The factor depends only on rate and term, so the power and the division
+    run once per (r, n) no matter how many principals share them.
+    """
+    one_plus_r_pow_n = (_ONE + monthly_rate) ** term_months
+    return monthly_rate * one_plus_r_pow_n / (one_plus_r_pow_n - _ONE)
 
 
+@lru_cache(maxsize=4096)
 def _compute_monthly_payment(principal: Decimal, monthly_rate: Decimal, term_months: int) -> Decimal:
     """Compute the fixed monthly payment for an amortizing loan.
 
@@ -48,116 +142,312 @@ def _compute_monthly_payment(principal: Decimal, monthly_rate: Decimal, term_mon
     """
     if monthly_rate == 0:
         return _to_cents(principal / Decimal(term_months))
-    one_plus_r_pow_n = (Decimal("1") + monthly_rate) ** term_months
-    raw_payment = principal * (monthly_rate * one_plus_r_pow_n) / (one_plus_r_pow_n - Decimal("1"))
-    return _to_cents(raw_payment)
+    return _to_cents(principal * _amortization_factor(monthly_rate, term_months))
 
 
-def _amortization_state_at_month(
-    principal: Decimal, monthly_rate: Decimal, term_months: int, month: int
-) -> tuple[Decimal, Decimal, Decimal]:
-    """Return remaining, total principal paid, and total interest paid after `month` payments.
+def _amortization_periods(
+    principal: Decimal, monthly_rate: Decimal, term_months: int, monthly_payment: Decimal
+):
+    """Yield (interest, principal paid, remaining) for each month of the term.
 
     Per-period interest equals remaining * r, rounded to cents. Principal paid
     equals payment minus interest. On the final month, principal is forced to
     clear the remaining balance and interest is adjusted so payment equals
     principal plus interest.
     """
-    monthly_payment = _compute_monthly_payment(principal, monthly_rate, term_months)
-
     remaining = principal
-    total_interest_paid = Decimal("0")
-    total_principal_paid = Decimal("0")
+    regular_months = range(term_months - 1)
 
-    if month <= 0:
-        return remaining, total_principal_paid, total_interest_paid
-
-    for i in range(1, month + 1):
-        if monthly_rate == 0:
-            interest = Decimal("0")
-        else:
+    # Interest is rounded to cents every period, so the balance has no exact
+    # closed form. Walk the regular months, then apply the payoff month once.
+    if monthly_rate == 0:
+        for _ in regular_months:
+            principal_payment = remaining if monthly_payment > remaining else monthly_payment
+            remaining = remaining - principal_payment
+            yield _ZERO_CENTS, principal_payment, remaining
+    else:
+        for _ in regular_months:
             interest = _to_cents(remaining * monthly_rate)
+            principal_payment = monthly_payment - interest
+            if principal_payment > remaining:
+                principal_payment = remaining
+
+            remaining = remaining - principal_payment
+            yield interest, principal_payment, remaining
 
-        principal_payment = monthly_payment - interest
+    yield monthly_payment - remaining, remaining, _ZERO_CENTS
 
-        if i == term_months:
-            principal_payment = remaining
-            interest = monthly_payment - principal_payment
 
-        if principal_payment > remaining:
-            principal_payment = remaining
+@lru_cache(maxsize=256)
+def _amortization_table(
+    principal: Decimal, monthly_rate: Decimal, term_months: int, monthly_payment: Decimal
+) -> tuple[tuple[Decimal, ...], tuple[Decimal, ...], tuple[Decimal, ...]]:
+    """Return remaining, total principal paid, and total interest paid after 0..n payments.
 
-        remaining = remaining - principal_payment
+    Each tuple has term_months + 1 entries rounded to cents, indexed by the
+    number of payments made. The recurrence runs once per loan; every
+    schedule row and summary month is then a lookup.
+    """
+    remaining_by_month = [_to_cents(principal)]
+    principal_paid_by_month = [_ZERO_CENTS]
+    interest_paid_by_month = [_ZERO_CENTS]
+
+    # Interest and the payment are whole cents, so a whole-cent principal
+    # keeps every running amount exact to the cent and rows need no rounding.
+    whole_cents = remaining_by_month[0] == principal
+    if whole_cents:
+        principal = remaining_by_month[0]
+
+    total_principal_paid = _ZERO_CENTS
+    total_interest_paid = _ZERO_CENTS
+    for interest, principal_payment, remaining in _amortization_periods(
+        principal, monthly_rate, term_months, monthly_payment
+    ):
         total_interest_paid += interest
         total_principal_paid += principal_payment
+        if whole_cents:
+            remaining_by_month.append(remaining)
+            principal_paid_by_month.append(total_principal_paid)
+            interest_paid_by_month.append(total_interest_paid)
+        else:
+            remaining_by_month.append(_to_cents(remaining))
+            principal_paid_by_month.append(_to_cents(total_principal_paid))
+            interest_paid_by_month.append(_to_cents(total_interest_paid))
+
+    return tuple(remaining_by_month), tuple(principal_paid_by_month), tuple(interest_paid_by_month)
+
+
+def amortization_state_at_month(
+    principal: Decimal,
+    monthly_rate: Decimal,
+    term_months: int,
+    month: int,
+    monthly_payment: Optional[Decimal] = None,
+) -> tuple[Decimal, Decimal, Decimal]:
+    """Return remaining, total principal paid, and total interest paid after `month` payments.
+
+    Public entry point for the summary math; `principal` and `monthly_rate`
+    are Decimals (rate as a monthly fraction). All three values are already
+    rounded to cents. `monthly_payment`
+    defaults to the value from `_compute_monthly_payment`; endpoints pass the
+    payment persisted on the loan row instead.
+    """
+    if month <= 0:
+        return _to_cents(principal), _ZERO_CENTS, _ZERO_CENTS
+
+    if monthly_payment is None:
+        monthly_payment = _compute_monthly_payment(principal, monthly_rate, term_months)
+
+    remaining, principal_paid, interest_paid = _amortization_table(
+        principal, monthly_rate, term_months, monthly_payment
+    )
+    month = min(month, term_months)
+    return remaining[month], principal_paid[month], interest_paid[month]
+
+
+@lru_cache(maxsize=256)
+def _schedule_json(
+    principal: Decimal, monthly_rate: Decimal, term_months: int, monthly_payment: Decimal
+) -> bytes:
+    """Return the schedule response body for a loan, encoded once.
+
+    Rows match LoanScheduleItem and hold plain JSON types, so the whole list
+    is serialized in one orjson call instead of being validated row by row.
+    """
+    payment = float(monthly_payment)
+    remaining_by_month, _, _ = _amortization_table(principal, monthly_rate, term_months, monthly_payment)
+    return orjson.dumps(
+        [
+            {"month": i, "remaining_balance": float(remaining), "monthly_payment": payment}
+            for i, remaining in enumerate(islice(remaining_by_month, 1, None), start=1)
+        ]
+    )
+
+
+def _to_loan_input(value: float) -> Decimal:
+    """Return a request float as a Decimal at the scale the loan columns store.
+
+    LoanBase already limits inputs to 6 decimal places and |value| < 1e9, so
+    this only fixes the exponent and never rounds or overflows.
+    """
+    return Decimal(str(value)).quantize(_LOAN_INPUT_SCALE, rounding=ROUND_HALF_UP)
 
-    return remaining, total_principal_paid, total_interest_paid
+
+@lru_cache(maxsize=1024)
+def _monthly_rate(annual_interest_rate: Decimal) -> Decimal:
+    """Convert an annual percentage rate to the monthly fraction used by the math."""
+    return annual_interest_rate / _HUNDRED / _TWELVE
+
+
+def _loan_inputs(loan: models.Loan) -> tuple[Decimal, Decimal]:
+    """Return the principal and monthly rate of a loan row.
+
+    The Numeric columns already load as Decimal, so no float/str conversion
+    happens on read, and the rate divisions are shared across loans.
+    """
+    return loan.amount, _monthly_rate(loan.annual_interest_rate)
+
+
+def _loan_monthly_payment(loan: models.Loan, principal: Decimal, monthly_rate: Decimal) -> Decimal:
+    """Return the payment stored on the loan, computing it for rows that predate the column.
+
+    Such rows come from databases upgraded by _upgrade_existing_schema.
+    """
+    if loan.monthly_payment is not None:
+        return loan.monthly_payment
+    return _compute_monthly_payment(principal, monthly_rate, loan.loan_term_in_months)
+
+
+def _warn_deprecated_summary_helper(name: str) -> None:
+    warnings.warn(
+        f"{name} is deprecated; use amortization_state_at_month, which returns all three values",
+        DeprecationWarning,
+        stacklevel=3,
+    )
 
 
 def current_principal_balance_at_month(
     principal: Decimal, monthly_rate: Decimal, term_months: int, month: int
 ) -> Decimal:
-    """Return the remaining principal after `month` payments, rounded to cents."""
-    remaining, _, _ = _amortization_state_at_month(principal, monthly_rate, term_months, month)
-    return _to_cents(remaining)
+    """Return the remaining principal after `month` payments, rounded to cents.
+
+    Deprecated: use `amortization_state_at_month`, which returns all three
+    summary values from one table lookup.
+    """
+    _warn_deprecated_summary_helper("current_principal_balance_at_month")
+    remaining, _, _ = amortization_state_at_month(principal, monthly_rate, term_months, month)
+    return remaining
 
 
 def total_principal_paid_at_month(
     principal: Decimal, monthly_rate: Decimal, term_months: int, month: int
 ) -> Decimal:
-    """Return the aggregate principal paid by the end of `month`, rounded to cents."""
-    _, total_principal_paid, _ = _amortization_state_at_month(principal, monthly_rate, term_months, month)
-    return _to_cents(total_principal_paid)
+    """Return the aggregate principal paid by the end of `month`, rounded to cents.
+
+    Deprecated: use `amortization_state_at_month`, which returns all three
+    summary values from one table lookup.
+    """
+    _warn_deprecated_summary_helper("total_principal_paid_at_month")
+    _, total_principal_paid, _ = amortization_state_at_month(principal, monthly_rate, term_months, month)
+    return total_principal_paid
 
 
 def total_interest_paid_at_month(
     principal: Decimal, monthly_rate: Decimal, term_months: int, month: int
 ) -> Decimal:
-    """Return the aggregate interest paid by the end of `month`, rounded to cents."""
-    _, _, total_interest_paid = _amortization_state_at_month(principal, monthly_rate, term_months, month)
-    return _to_cents(total_interest_paid)
+    """Return the aggregate interest paid by the end of `month`, rounded to cents.
+
+    Deprecated: use `amortization_state_at_month`, which returns all three
+    summary values from one table lookup.
+    """
+    _warn_deprecated_summary_helper("total_interest_paid_at_month")
+    _, _, total_interest_paid = amortization_state_at_month(principal, monthly_rate, term_months, month)
+    return total_interest_paid
+
+
+def _build_loan(loan: schemas.LoanCreate) -> models.Loan:
+    """Return a new Loan row with normalized inputs and its persisted payment."""
+    db_loan = models.Loan(
+        user_id=loan.user_id,
+        amount=_to_loan_input(loan.amount),
+        annual_interest_rate=_to_loan_input(loan.annual_interest_rate),
+        loan_term_in_months=loan.loan_term_in_months,
+    )
+    if loan.loan_term_in_months > 0:
+        # Reads reuse the persisted payment instead of redoing (1 + r) ** n.
+        db_loan.monthly_payment = _compute_monthly_payment(*_loan_inputs(db_loan), loan.loan_term_in_months)
+    return db_loan
+
+
+def _shared_user_ids(db: Session, loan_id: int) -> List[int]:
+    """Return ids of users a loan is shared with, read from the association table."""
+    stmt = lambda_stmt(
+        lambda: select(models.loan_shares.c.user_id)
+        .where(models.loan_shares.c.loan_id == loan_id)
+        .order_by(models.loan_shares.c.user_id)
+    )
+    return list(db.execute(stmt).scalars())
+
+
+# The hot lookups below are lambda statements: SQLAlchemy builds and compiles
+# each one once and only rebinds the closure values on later calls.
+
+def _user_exists(db: Session, user_id: int) -> bool:
+    """Return whether a user with this id exists, without loading the row."""
+    return db.execute(lambda_stmt(lambda: select(exists().where(models.User.id == user_id)))).scalar()
+
+
+def _loans_for_user(db: Session, user_id: int) -> List[models.Loan]:
+    """Return the loans owned by a user with only the LoanRead columns loaded."""
+    stmt = lambda_stmt(
+        lambda: select(models.Loan)
+        .options(_LOAN_READ_COLUMNS, _NO_RELATIONSHIP_LOADS)
+        .where(models.Loan.user_id == user_id)
+    )
+    return list(db.execute(stmt).scalars())
+
+
+def _loans_page(db: Session, after_id: int, limit: int) -> List[models.Loan]:
+    """Return up to `limit` loans with ids above `after_id`, LoanRead columns only."""
+    return (
+        db.query(models.Loan)
+        .options(_LOAN_READ_COLUMNS, _NO_RELATIONSHIP_LOADS)
+        .filter(models.Loan.id > after_id)
+        .order_by(models.Loan.id)
+        .limit(limit)
+        .all()
+    )
 
 
 # User endpoints
 @app.post("/users", response_model=schemas.UserRead, status_code=status.HTTP_201_CREATED)
 def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
     """Create a new user with a unique username and email."""
-    logger.info("POST /users - creating user username=%s email=%s", user.username, user.email)
-    existing = (
-        db.query(models.User)
-        .filter((models.User.username == user.username) | (models.User.email == user.email))
-        .first()
-    )
-    if existing:
-        logger.info("POST /users - conflict for username=%s or email=%s", user.username, user.email)
-        raise HTTPException(status_code=400, detail="Username or email already exists")
-
+    logger.debug("POST /users - creating user username=%s email=%s", user.username, user.email)
+    # Uniqueness is enforced by the username/email unique indexes, so the
+    # happy path is a single INSERT with no pre-check SELECT.
     db_user = models.User(**user.model_dump())
     db.add(db_user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        logger.info("POST /users - conflict for username=%s or email=%s", user.username, user.email)
+        raise HTTPException(status_code=400, detail="Username or email already exists")
     db.refresh(db_user)
     logger.info("POST /users - created user id=%s", db_user.id)
     return db_user
 
 
 @app.get("/users", response_model=List[schemas.UserRead])
-def list_users(db: Session = Depends(get_db)):
-    """Return all users."""
-    users = db.query(models.User).all()
-    logger.info("GET /users - returned count=%s", len(users))
+def list_users(
+    limit: int = Query(_DEFAULT_PAGE_SIZE, ge=1, le=_MAX_PAGE_SIZE),
+    after_id: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """Return one page of users ordered by id, starting after `after_id`."""
+    users = (
+        db.query(models.User)
+        .options(_USER_READ_COLUMNS)
+        .filter(models.User.id > after_id)
+        .order_by(models.User.id)
+        .limit(limit)
+        .all()
+    )
+    logger.debug("GET /users - returned count=%s", len(users))
     return users
 
 
 @app.get("/users/{user_id}/loans", response_model=List[schemas.LoanRead])
 def list_loans_for_user(user_id: int, db: Session = Depends(get_db)):
     """Return all loans owned by a specific user."""
-    logger.info("GET /users/%s/loans - listing", user_id)
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
+    logger.debug("GET /users/%s/loans - listing", user_id)
+    user_exists = _user_exists(db, user_id)
+    if not user_exists:
         logger.info("GET /users/%s/loans - user not found", user_id)
         raise HTTPException(status_code=404, detail="User not found")
-    loans = db.query(models.Loan).filter(models.Loan.user_id == user_id).all()
-    logger.info("GET /users/%s/loans - returned count=%s", user_id, len(loans))
+    loans = _loans_for_user(db, user_id)
+    logger.debug("GET /users/%s/loans - returned count=%s", user_id, len(loans))
     return loans
 
 
@@ -165,19 +455,19 @@ def list_loans_for_user(user_id: int, db: Session = Depends(get_db)):
 @app.post("/loans", response_model=schemas.LoanRead, status_code=status.HTTP_201_CREATED)
 def create_loan(loan: schemas.LoanCreate, db: Session = Depends(get_db)):
     """Create a new loan for the specified owner."""
-    logger.info(
+    logger.debug(
         "POST /loans - creating loan user_id=%s amount=%s rate=%s term=%s",
         loan.user_id,
         loan.amount,
         loan.annual_interest_rate,
         loan.loan_term_in_months,
     )
-    user = db.query(models.User).filter(models.User.id == loan.user_id).first()
-    if not user:
+    owner_exists = _user_exists(db, loan.user_id)
+    if not owner_exists:
         logger.info("POST /loans - owner user_id=%s not found", loan.user_id)
         raise HTTPException(status_code=404, detail="User not found")
 
-    db_loan = models.Loan(**loan.model_dump())
+    db_loan = _build_loan(loan)
     db.add(db_loan)
     db.commit()
     db.refresh(db_loan)
@@ -186,59 +476,69 @@ def create_loan(loan: schemas.LoanCreate, db: Session = Depends(get_db)):
 
 
 @app.get("/loans", response_model=List[schemas.LoanRead])
-def list_loans(db: Session = Depends(get_db)):
-    """Return all loans."""
-    loans = db.query(models.Loan).all()
-    logger.info("GET /loans - returned count=%s", len(loans))
+def list_loans(
+    limit: int = Query(_DEFAULT_PAGE_SIZE, ge=1, le=_MAX_PAGE_SIZE),
+    after_id: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """Return one page of loans ordered by id, starting after `after_id`."""
+    loans = _loans_page(db, after_id, limit)
+    logger.debug("GET /loans - returned count=%s", len(loans))
     return loans
 
 
 @app.get("/loans/{loan_id}", response_model=schemas.LoanRead)
 def get_loan(loan_id: int, db: Session = Depends(get_db)):
     """Return a single loan by id including shared user ids."""
-    logger.info("GET /loans/%s - fetching", loan_id)
-    loan = db.query(models.Loan).filter(models.Loan.id == loan_id).first()
+    logger.debug("GET /loans/%s - fetching", loan_id)
+    loan = db.get(models.Loan, loan_id, options=[_NO_RELATIONSHIP_LOADS])
     if not loan:
         logger.info("GET /loans/%s - not found", loan_id)
         raise HTTPException(status_code=404, detail="Loan not found")
-    logger.info("GET /loans/%s - found", loan_id)
+    logger.debug("GET /loans/%s - found", loan_id)
     return schemas.LoanRead(
         id=loan.id,
         user_id=loan.user_id,
         amount=loan.amount,
         annual_interest_rate=loan.annual_interest_rate,
         loan_term_in_months=loan.loan_term_in_months,
-        shared_user_ids=[u.id for u in loan.shared_users],
+        shared_user_ids=_shared_user_ids(db, loan.id),
     )
 
 
 @app.post("/loans/{loan_id}/share", response_model=schemas.LoanRead)
 def share_loan(loan_id: int, payload: schemas.LoanShareRequest, db: Session = Depends(get_db)):
     """Grant another user read-only access to an existing loan."""
-    logger.info("POST /loans/%s/share - sharing with user_id=%s", loan_id, payload.user_id)
-    loan = db.query(models.Loan).filter(models.Loan.id == loan_id).first()
+    logger.debug("POST /loans/%s/share - sharing with user_id=%s", loan_id, payload.user_id)
+    loan = db.get(models.Loan, loan_id, options=[_NO_RELATIONSHIP_LOADS])
     if not loan:
         logger.info("POST /loans/%s/share - loan not found", loan_id)
         raise HTTPException(status_code=404, detail="Loan not found")
 
-    user_to_share = db.query(models.User).filter(models.User.id == payload.user_id).first()
-    if not user_to_share:
+    user_exists = _user_exists(db, payload.user_id)
+    if not user_exists:
         logger.info("POST /loans/%s/share - user_id=%s not found", loan_id, payload.user_id)
         raise HTTPException(status_code=404, detail="User to share with not found")
 
-    if user_to_share.id == loan.user_id:
+    if payload.user_id == loan.user_id:
         logger.info("POST /loans/%s/share - cannot share to owner user_id=%s", loan_id, payload.user_id)
         raise HTTPException(status_code=400, detail="Owner already has access to this loan")
 
-    if user_to_share in loan.shared_users:
+    # Check and record the share on the association table directly so the
+    # loan's shared_users collection is never materialized for the write.
+    already_shared = db.query(
+        exists().where(
+            (models.loan_shares.c.loan_id == loan.id) & (models.loan_shares.c.user_id == payload.user_id)
+        )
+    ).scalar()
+    if already_shared:
         logger.info("POST /loans/%s/share - already shared to user_id=%s", loan_id, payload.user_id)
         raise HTTPException(status_code=400, detail="Loan already shared with this user")
 
-    loan.shared_users.append(user_to_share)
-    db.add(loan)
+    db.execute(models.loan_shares.insert().values(loan_id=loan.id, user_id=payload.user_id))
     db.commit()
-    db.refresh(loan)
-    logger.info("POST /loans/%s/share - now shared_count=%s", loan_id, len(loan.shared_users))
+    shared_user_ids = _shared_user_ids(db, loan.id)
+    logger.info("POST /loans/%s/share - now shared_count=%s", loan_id, len(shared_user_ids))
 
     return schemas.LoanRead(
         id=loan.id,
@@ -246,15 +546,15 @@ def share_loan(loan_id: int, payload: schemas.LoanShareRequest, db: Session = De
         amount=loan.amount,
         annual_interest_rate=loan.annual_interest_rate,
         loan_term_in_months=loan.loan_term_in_months,
-        shared_user_ids=[u.id for u in loan.shared_users],
+        shared_user_ids=shared_user_ids,
     )
 
 
 @app.get("/loans/{loan_id}/schedule", response_model=List[schemas.LoanScheduleItem])
 def get_loan_schedule(loan_id: int, db: Session = Depends(get_db)):
     """Return the amortization schedule with monthly payment and remaining balance."""
-    logger.info("GET /loans/%s/schedule - computing schedule", loan_id)
-    loan = db.query(models.Loan).filter(models.Loan.id == loan_id).first()
+    logger.debug("GET /loans/%s/schedule - computing schedule", loan_id)
+    loan = db.get(models.Loan, loan_id, options=[_NO_RELATIONSHIP_LOADS])
     if not loan:
         logger.info("GET /loans/%s/schedule - loan not found", loan_id)
         raise HTTPException(status_code=404, detail="Loan not found")
@@ -264,10 +564,9 @@ def get_loan_schedule(loan_id: int, db: Session = Depends(get_db)):
         logger.info("GET /loans/%s/schedule - invalid term=%s", loan_id, n)
         raise HTTPException(status_code=400, detail="Loan term must be positive")
 
-    P = Decimal(str(loan.amount))
-    r_monthly = Decimal(str(loan.annual_interest_rate)) / Decimal("100") / Decimal("12")
-    monthly_payment = _compute_monthly_payment(P, r_monthly, n)
-    logger.info(
+    P, r_monthly = _loan_inputs(loan)
+    monthly_payment = _loan_monthly_payment(loan, P, r_monthly)
+    logger.debug(
         "GET /loans/%s/schedule - amount=%s rate=%s term=%s monthly_payment=%s",
         loan_id,
         P,
@@ -276,36 +575,16 @@ def get_loan_schedule(loan_id: int, db: Session = Depends(get_db)):
         monthly_payment,
     )
 
-    schedule: List[schemas.LoanScheduleItem] = []
-    remaining = P
-
-    for i in range(1, n + 1):
-        interest = Decimal("0") if r_monthly == 0 else _to_cents(remaining * r_monthly)
-        principal_payment = monthly_payment - interest
-        if i == n:
-            principal_payment = remaining
-            interest = monthly_payment - principal_payment
-        if principal_payment > remaining:
-            principal_payment = remaining
-        remaining = remaining - principal_payment
-
-        schedule.append(
-            schemas.LoanScheduleItem(
-                month=i,
-                remaining_balance=float(_to_cents(remaining)),
-                monthly_payment=float(monthly_payment),
-            )
-        )
-
-    logger.info("GET /loans/%s/schedule - generated rows=%s", loan_id, len(schedule))
-    return schedule
+    content = _schedule_json(P, r_monthly, n, monthly_payment)
+    logger.debug("GET /loans/%s/schedule - generated rows=%s", loan_id, n)
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/loans/{loan_id}/summary", response_model=schemas.LoanSummary)
 def get_loan_summary(loan_id: int, month: int, db: Session = Depends(get_db)):
     """Return remaining principal, total principal, and total interest paid at a given month."""
-    logger.info("GET /loans/%s/summary - month=%s", loan_id, month)
-    loan = db.query(models.Loan).filter(models.Loan.id == loan_id).first()
+    logger.debug("GET /loans/%s/summary - month=%s", loan_id, month)
+    loan = db.get(models.Loan, loan_id, options=[_NO_RELATIONSHIP_LOADS])
     if not loan:
         logger.info("GET /loans/%s/summary - loan not found", loan_id)
         raise HTTPException(status_code=404, detail="Loan not found")
@@ -318,14 +597,14 @@ def get_loan_summary(loan_id: int, month: int, db: Session = Depends(get_db)):
         logger.info("GET /loans/%s/summary - invalid month=%s (term=%s)", loan_id, month, n)
         raise HTTPException(status_code=400, detail=f"month must be between 0 and {n}")
 
-    P = Decimal(str(loan.amount))
-    r_monthly = Decimal(str(loan.annual_interest_rate)) / Decimal("100") / Decimal("12")
+    P, r_monthly = _loan_inputs(loan)
+    monthly_payment = _loan_monthly_payment(loan, P, r_monthly)
 
-    remaining = current_principal_balance_at_month(P, r_monthly, n, month)
-    total_principal = total_principal_paid_at_month(P, r_monthly, n, month)
-    total_interest = total_interest_paid_at_month(P, r_monthly, n, month)
+    remaining, total_principal, total_interest = amortization_state_at_month(
+        P, r_monthly, n, month, monthly_payment
+    )
 
-    logger.info(
+    logger.debug(
         "GET /loans/%s/summary - remaining=%s principal_paid=%s interest_paid=%s",
         loan_id,
         remaining,
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, Numeric, Table
 from sqlalchemy.orm import relationship
 
 from .database import Base
@@ -10,6 +10,8 @@ loan_shares = Table(
     Base.metadata,
     Column("loan_id", Integer, ForeignKey("loans.id", ondelete="CASCADE"), primary_key=True),
     Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    # The (loan_id, user_id) primary key already covers lookups by loan_id
+    Index("ix_loan_shares_user_id", "user_id"),
 )
 
 
@@ -38,11 +40,16 @@ class Loan(Base):
     __tablename__ = "loans"
 
     id = Column(Integer, primary_key=True, index=True)
-    amount = Column(Float, nullable=False)
-    annual_interest_rate = Column(Float, nullable=False)
+    # Numeric so reads hand the amortization math Decimals directly. SQLite stores
+    # these as REAL; schemas.LoanBase caps inputs at 15 significant digits so the
+    # value read back (and the payment computed from it) matches what was written.
+    amount = Column(Numeric(18, 6), nullable=False)
+    annual_interest_rate = Column(Numeric(18, 6), nullable=False)
     loan_term_in_months = Column(Integer, nullable=False)
+    # Fixed monthly payment computed once at creation; NULL when the term is not positive
+    monthly_payment = Column(Numeric(14, 2), nullable=True)
 
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     user = relationship("User", back_populates="loans")
 
     # Users who have been granted read access to this loan (besides the owner)
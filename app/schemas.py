@@ -1,5 +1,13 @@
+from decimal import Decimal
 from typing import Optional, List
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, EmailStr, ConfigDict, Field, field_validator
+
+# Loan inputs are stored in Numeric(18, 6) columns, which SQLite keeps as REAL.
+# At most 6 decimal places and |value| < 1e9 keeps every accepted value within
+# 15 significant digits, so it reads back exactly as written. These limits only
+# apply on create; reads serve whatever an existing database holds.
+LOAN_INPUT_DECIMAL_PLACES = 6
+LOAN_INPUT_MAX_ABS = 1e9
 
 
 class UserBase(BaseModel):
@@ -24,8 +32,17 @@ class LoanBase(BaseModel):
 
 
 class LoanCreate(LoanBase):
+    amount: float = Field(allow_inf_nan=False, gt=-LOAN_INPUT_MAX_ABS, lt=LOAN_INPUT_MAX_ABS)
+    annual_interest_rate: float = Field(allow_inf_nan=False, gt=-LOAN_INPUT_MAX_ABS, lt=LOAN_INPUT_MAX_ABS)
     user_id: int
 
+    @field_validator("amount", "annual_interest_rate")
+    @classmethod
+    def _check_decimal_places(cls, value: float) -> float:
+        if Decimal(str(value)).as_tuple().exponent < -LOAN_INPUT_DECIMAL_PLACES:
+            raise ValueError(f"must have at most {LOAN_INPUT_DECIMAL_PLACES} decimal places")
+        return value
+
 
 class LoanRead(LoanBase):
     id: int
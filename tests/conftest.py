@@ -3,7 +3,7 @@ import sys
 import tempfile
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 # Ensure project root is on sys.path so 'app' can be imported when running pytest
@@ -11,22 +11,36 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from app.main import app
+from app import models, schemas
+from app.main import _build_loan, app
 from app.database import Base, get_db
 
 
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: long-running case, run after the rest of the suite")
+
+
+def pytest_collection_modifyitems(config, items):
+    # Run slow cases last so failures in the quick tests surface first;
+    # they are reordered, never skipped. Use -m "not slow" to leave them out.
+    items.sort(key=lambda item: item.get_closest_marker("slow") is not None)
+
+
 @pytest.fixture(scope="session")
 def db_file_path():
-    # Use a temporary SQLite file to persist across requests within tests
+    # Use a temporary SQLite file to persist across requests within tests.
+    # Each pytest-xdist worker is its own process and gets its own file.
     fd, path = tempfile.mkstemp(suffix=".sqlite3")
     os.close(fd)
     try:
         yield path
     finally:
-        try:
-            os.remove(path)
-        except FileNotFoundError:
-            pass
+        # WAL mode leaves -wal/-shm side files next to the database
+        for leftover in (path, f"{path}-wal", f"{path}-shm"):
+            try:
+                os.remove(leftover)
+            except FileNotFoundError:
+                pass
 
 
 @pytest.fixture(scope="session")
@@ -34,26 +48,61 @@ def engine(db_file_path):
     engine = create_engine(
         f"sqlite:///{db_file_path}", connect_args={"check_same_thread": False}
     )
-    Base.metadata.create_all(bind=engine)
-    return engine
 
+    # Every test commits several times; WAL with synchronous=NORMAL skips the
+    # per-commit fsync, which is all a throwaway test database needs.
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        # Let SQLAlchemy emit BEGIN itself; pysqlite's implicit transactions
+        # do not mix with the SAVEPOINTs each test runs inside.
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-@pytest.fixture()
-def db_session(engine):
-    # Reset schema for test isolation
-    Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
 
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = TestingSessionLocal()
+@pytest.fixture(scope="session")
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture()
+def db_session(engine, session_factory):
+    # Run each test inside an outer transaction that is rolled back afterwards;
+    # endpoint commits and rollbacks only release or roll back SAVEPOINTs.
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = session_factory(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def _session_client():
+    # One TestClient (and app startup) for the whole run; tests get isolation
+    # from db_session instead.
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture()
-def client(db_session):
+def client(_session_client, db_session):
     def override_get_db():
         try:
             yield db_session
@@ -61,6 +110,34 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as c:
-        yield c
+    yield _session_client
     app.dependency_overrides.clear()
+
+
+# Factories that insert rows straight through the test session, for tests that
+# only need existing users/loans and exercise the read endpoints.
+
+@pytest.fixture()
+def make_user(db_session):
+    def _make_user(username: str, email: str) -> int:
+        user = models.User(username=username, email=email)
+        db_session.add(user)
+        db_session.flush()
+        return user.id
+
+    return _make_user
+
+
+@pytest.fixture()
+def make_loan(db_session):
+    def _make_loan(owner_id: int, amount=10000.0, rate=6.0, term=12) -> int:
+        loan = _build_loan(
+            schemas.LoanCreate(
+                user_id=owner_id, amount=amount, annual_interest_rate=rate, loan_term_in_months=term
+            )
+        )
+        db_session.add(loan)
+        db_session.flush()
+        return loan.id
+
+    return _make_loan
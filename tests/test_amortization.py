@@ -0,0 +1,32 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+from app.main import (
+    _compute_monthly_payment,
+    _monthly_rate,
+    _to_loan_input,
+    amortization_state_at_month,
+)
+
+_CENTS = Decimal("0.01")
+
+
+# Pure amortization math, called in-process; HTTP behaviour is covered in test_loans.py
+
+def _normalized_inputs(amount: float, rate: float) -> tuple[Decimal, Decimal]:
+    # Normalize the way POST /loans stores them
+    return _to_loan_input(amount), _monthly_rate(_to_loan_input(rate))
+
+
+# Identity check: for any month, total_principal_paid + current_principal_balance == original principal (to cents)
+
+def test_financial_identity_by_month():
+    amount = Decimal("54321.0")
+    rate = 7.25
+    term = 36
+    P, r = _normalized_inputs(float(amount), rate)
+    payment = _compute_monthly_payment(P, r, term)
+    expected_total = amount.quantize(_CENTS, rounding=ROUND_HALF_UP)
+
+    for month in range(term + 1):
+        remaining, total_principal_paid, _ = amortization_state_at_month(P, r, term, month, payment)
+        assert total_principal_paid + remaining == expected_total
@@ -1,6 +1,33 @@
 from fastapi.testclient import TestClient
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from itertools import accumulate
 import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.main import (
+    _loans_for_user,
+    _loans_page,
+    _upgrade_existing_schema,
+    amortization_state_at_month,
+    app,
+    current_principal_balance_at_month,
+    total_interest_paid_at_month,
+    total_principal_paid_at_month,
+)
+
+# Decimal constants used by the oracle and assertions, parsed once
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_TWELVE = Decimal("12")
+_HUNDRED = Decimal("100")
+_CENTS = Decimal("0.01")
+_ZERO_CENTS = Decimal("0.00")
+# Slack for comparing successive balances
+_EPSILON = Decimal("0.000000001")
 
 
 # Helper: create a user and return its id
@@ -45,6 +72,109 @@ def test_create_and_list_loans(client: TestClient):
     assert data["user_id"] == owner_id
 
 
+# /loans is keyset-paginated like /users, with a bounded page size
+
+def test_list_loans_pagination(client: TestClient):
+    owner_id = _create_user(client, "pager", "pager@example.com")
+    ids = [_create_loan(client, owner_id) for _ in range(3)]
+
+    # Default page holds every loan here; then page through two at a time
+    assert [loan["id"] for loan in client.get("/loans").json()] == ids
+    page1 = client.get("/loans", params={"limit": 2}).json()
+    assert [loan["id"] for loan in page1] == ids[:2]
+    page2 = client.get("/loans", params={"limit": 2, "after_id": page1[-1]["id"]}).json()
+    assert [loan["id"] for loan in page2] == ids[2:]
+    assert client.get("/loans", params={"after_id": ids[-1]}).json() == []
+
+    # Page size and cursor are bounded
+    assert client.get("/loans", params={"limit": 0}).status_code == 422
+    assert client.get("/loans", params={"limit": 1001}).status_code == 422
+    assert client.get("/loans", params={"after_id": -1}).status_code == 422
+
+
+def test_list_loans_default_page_size(client: TestClient, make_user, make_loan):
+    owner_id = make_user("bulk", "bulk@example.com")
+    ids = [make_loan(owner_id) for _ in range(101)]
+
+    # Without a limit, /loans returns the first 100 rows rather than everything
+    assert [loan["id"] for loan in client.get("/loans").json()] == ids[:100]
+    assert [loan["id"] for loan in client.get("/loans", params={"after_id": ids[99]}).json()] == ids[100:]
+
+
+# Loan inputs outside what the Numeric(18, 6) columns hold exactly are rejected, not rounded
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("amount", 1e22),
+        ("amount", float("inf")),
+        ("amount", 1000.1234567),
+        ("annual_interest_rate", 1e-9),
+        ("annual_interest_rate", float("nan")),
+    ],
+)
+def test_create_loan_rejects_unrepresentable_inputs(client: TestClient, field, value):
+    owner_id = _create_user(client, "bounds", "bounds@example.com")
+    body = {"user_id": owner_id, "amount": 10000.0, "annual_interest_rate": 6.0, "loan_term_in_months": 12}
+    body[field] = value
+
+    r = client.post("/loans", json=body)
+    assert r.status_code == 422, r.text
+    assert client.get("/loans").json() == []
+
+
+def test_create_loan_keeps_largest_accepted_inputs_exact(client: TestClient):
+    owner_id = _create_user(client, "bigloan", "bigloan@example.com")
+    loan_id = _create_loan(client, owner_id, amount=999999999.999999, rate=0.000001, term=12)
+
+    data = client.get(f"/loans/{loan_id}").json()
+    assert data["amount"] == 999999999.999999
+    assert data["annual_interest_rate"] == 0.000001
+    assert client.get(f"/loans/{loan_id}/summary", params={"month": 12}).json()["total_principal_paid"] == 1000000000.0
+
+
+# Lists only the loans owned by a user; unknown user is 404
+
+def test_list_loans_for_user(client: TestClient):
+    owner_id = _create_user(client, "lister", "lister@example.com")
+    other_id = _create_user(client, "other", "other@example.com")
+    loan_id = _create_loan(client, owner_id)
+    _create_loan(client, other_id)
+
+    r = client.get(f"/users/{owner_id}/loans")
+    assert r.status_code == 200
+    loans = r.json()
+    assert [loan["id"] for loan in loans] == [loan_id]
+    assert loans[0]["amount"] == 10000.0
+
+    r_missing = client.get("/users/999/loans")
+    assert r_missing.status_code == 404
+
+
+# List endpoints never touch relationships, even for shared loans
+
+def test_list_shared_loans_without_relationship_loads(client: TestClient, db_session):
+    owner_id = _create_user(client, "sharer", "sharer@example.com")
+    other_id = _create_user(client, "sharee", "sharee@example.com")
+    loan_id = _create_loan(client, owner_id)
+    assert client.post(f"/loans/{loan_id}/share", json={"user_id": other_id}).status_code == 200
+
+    for url in (f"/users/{owner_id}/loans", "/loans"):
+        r = client.get(url)
+        assert r.status_code == 200
+        assert [loan["id"] for loan in r.json()] == [loan_id]
+
+    # Rows loaded by the list queries refuse lazy relationship loads instead of
+    # silently issuing one SELECT per loan
+    for load in (lambda: _loans_for_user(db_session, owner_id), lambda: _loans_page(db_session, 0, 100)):
+        db_session.expunge_all()  # reload, rather than reuse the rows the POSTs left in the session
+        (loan,) = load()
+        with pytest.raises(InvalidRequestError):
+            loan.shared_users
+        with pytest.raises(InvalidRequestError):
+            loan.user
+
+
 # Validates schedule endpoint returns term-length array with expected fields
 
 def test_schedule_length_and_fields(client: TestClient):
@@ -56,7 +186,19 @@ def test_schedule_length_and_fields(client: TestClient):
     schedule = r.json()
     assert len(schedule) == 12
     first = schedule[0]
-    assert set(first.keys()) == {"month", "remaining_balance", "monthly_payment"}
+    assert first.keys() == {"month", "remaining_balance", "monthly_payment"}
+
+
+# Long schedules are gzip-compressed when the client accepts it
+
+def test_schedule_is_gzipped(client: TestClient):
+    owner_id = _create_user(client, "gz", "gz@example.com")
+    loan_id = _create_loan(client, owner_id, amount=250000.0, rate=5.5, term=360)
+
+    r = client.get(f"/loans/{loan_id}/schedule", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers["content-encoding"] == "gzip"
+    assert len(r.json()) == 360
 
 
 # Validates summary endpoint input range and basic outputs at month 0 and mid-term
@@ -92,6 +234,8 @@ def test_share_same_user_twice_errors(client: TestClient):
 
     r1 = client.post(f"/loans/{loan_id}/share", json={"user_id": other_id})
     assert r1.status_code == 200
+    assert r1.json()["shared_user_ids"] == [other_id]
+    assert client.get(f"/loans/{loan_id}").json()["shared_user_ids"] == [other_id]
 
     r2 = client.post(f"/loans/{loan_id}/share", json={"user_id": other_id})
     assert r2.status_code == 400
@@ -126,46 +270,45 @@ def test_summary_month_param_validation(client: TestClient):
 
 # Zero-interest loan: principal paid and remaining are linear over time, no interest paid
 
-def test_summary_zero_interest_linear_behavior(client: TestClient):
-    owner_id = _create_user(client, "zeroi", "zeroi@example.com")
-    amount = Decimal("1200.0")
+def test_summary_zero_interest_linear_behavior(client: TestClient, make_user, make_loan):
+    owner_id = make_user("zeroi", "zeroi@example.com")
+    amount = 1200.0
     term = 12
-    loan_id = _create_loan(client, owner_id, amount=float(amount), rate=0.0, term=term)
+    loan_id = make_loan(owner_id, amount=amount, rate=0.0, term=term)
 
-    # month 6: half principal paid, half remaining (with 2-dec rounding)
+    # month 6: half principal paid, half remaining. The split is whole cents,
+    # so plain floats are exact here and compare without tolerance.
     r6 = client.get(f"/loans/{loan_id}/summary", params={"month": 6})
     assert r6.status_code == 200
     d6 = r6.json()
-    total_principal_paid = Decimal(str(d6["total_principal_paid"]))
-    current_balance = Decimal(str(d6["current_principal_balance"]))
-    assert total_principal_paid == (amount * Decimal(6) / Decimal(term)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    assert current_balance == (amount * (Decimal(1) - Decimal(6) / Decimal(term))).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    assert Decimal(str(d6["total_interest_paid"])) == Decimal("0.00")
+    assert d6["total_principal_paid"] == round(amount * 6 / term, 2)
+    assert d6["current_principal_balance"] == round(amount * (1 - 6 / term), 2)
+    assert d6["total_interest_paid"] == 0.0
 
 
 # Schedule: term=0 rejected; valid schedule has constant payment, non-increasing balances, and ends at 0
 
-def test_schedule_term_validation_and_monotonicity(client: TestClient):
-    owner_id = _create_user(client, "schedv", "schedv@example.com")
+def test_schedule_term_validation_and_monotonicity(client: TestClient, make_user, make_loan):
+    owner_id = make_user("schedv", "schedv@example.com")
 
     # Term 0 should be rejected by endpoint
-    loan_zero_term = _create_loan(client, owner_id, amount=1000.0, rate=5.0, term=0)
+    loan_zero_term = make_loan(owner_id, amount=1000.0, rate=5.0, term=0)
     r_zero = client.get(f"/loans/{loan_zero_term}/schedule")
     assert r_zero.status_code == 400
 
     # Valid loan: payment constant and balance decreases to ~0
-    loan_id = _create_loan(client, owner_id, amount=10000.0, rate=6.0, term=24)
+    loan_id = make_loan(owner_id, amount=10000.0, rate=6.0, term=24)
     r = client.get(f"/loans/{loan_id}/schedule")
     assert r.status_code == 200
-    schedule = r.json()
-    payments = [Decimal(str(row["monthly_payment"])) for row in schedule]
-    balances = [Decimal(str(row["remaining_balance"])) for row in schedule]
+    schedule = r.json(parse_float=Decimal)
+    first_payment = schedule[0]["monthly_payment"]
+    balances = [row["remaining_balance"] for row in schedule]
 
-    assert all(pay == payments[0] for pay in payments)
+    assert all(row["monthly_payment"] == first_payment for row in schedule)
     # Non-increasing balances
-    assert all(balances[i] <= balances[i - 1] + Decimal("0.000000001") for i in range(1, len(balances)))
+    assert all(cur <= prev + _EPSILON for prev, cur in zip(balances, balances[1:]))
     # Last balance should be zero (clamped)
-    assert balances[-1].quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) == Decimal("0.00")
+    assert balances[-1].quantize(_CENTS, rounding=ROUND_HALF_UP) == _ZERO_CENTS
 
 
 # --------------- Happy path tests ---------------
@@ -173,7 +316,7 @@ def test_schedule_term_validation_and_monotonicity(client: TestClient):
 # Helper: round Decimal to cents (banker's rounding per endpoint)
 
 def _to_cents(d: Decimal) -> Decimal:
-    return d.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return d.quantize(_CENTS, rounding=ROUND_HALF_UP)
 
 
 # Helper: build expected amortization path matching endpoint logic and rounding rules
@@ -183,18 +326,26 @@ def _expected_amortization(principal: float, annual_rate: float, term_months: in
     Uses the same rounding approach as the summary/schedule endpoints: payment rounded to cents,
     interest per month rounded to cents, principal = payment - interest, clamp/adjust on final month.
     """
+    yield from _amortization_rows(principal, annual_rate, term_months)
+
+
+# Parametrized cases share (amount, rate, term) triples, so each path is built once
+
+@lru_cache(maxsize=64)
+def _amortization_rows(principal: float, annual_rate: float, term_months: int):
     P = Decimal(str(principal))
-    r = Decimal(str(annual_rate)) / Decimal("100") / Decimal("12")
+    r = Decimal(str(annual_rate)) / _HUNDRED / _TWELVE
     n = term_months
     if r == 0:
         payment = _to_cents(P / Decimal(n))
     else:
-        one_plus_r_pow_n = (Decimal("1") + r) ** n
-        payment = _to_cents(P * (r * one_plus_r_pow_n) / (one_plus_r_pow_n - Decimal("1")))
+        one_plus_r_pow_n = (_ONE + r) ** n
+        payment = _to_cents(P * (r * one_plus_r_pow_n) / (one_plus_r_pow_n - _ONE))
 
+    rows = []
     remaining = P
     for m in range(1, n + 1):
-        interest = Decimal("0") if r == 0 else _to_cents(remaining * r)
+        interest = _ZERO if r == 0 else _to_cents(remaining * r)
         principal_paid = payment - interest
         if m == n:
             # Final month: exact payoff and adjust interest so payment = principal + interest
@@ -203,56 +354,69 @@ def _expected_amortization(principal: float, annual_rate: float, term_months: in
         if principal_paid > remaining:
             principal_paid = remaining
         remaining = remaining - principal_paid
-        yield m, payment, interest, principal_paid, remaining
+        rows.append((m, payment, interest, principal_paid, remaining))
+    return tuple(rows)
+
+
+# Helper: running (total interest, total principal) after each month, built in one pass
+
+@lru_cache(maxsize=64)
+def _expected_running_totals(principal: float, annual_rate: float, term_months: int):
+    rows = _amortization_rows(principal, annual_rate, term_months)
+    cum_interest = tuple(accumulate(row[2] for row in rows))  # Decimal
+    cum_principal = tuple(accumulate(row[3] for row in rows))  # Decimal
+    return cum_interest, cum_principal
 
 
 # Schedule happy path: monthly payment matches formula and balance ends at 0.00
 
-def test_schedule_happy_path_matches_payment_formula(client: TestClient):
-    owner_id = _create_user(client, "schedhappy", "schedhappy@example.com")
+def test_schedule_happy_path_matches_payment_formula(client: TestClient, make_user, make_loan):
+    owner_id = make_user("schedhappy", "schedhappy@example.com")
     amount = 15000.0
     rate = 7.5
     term = 36
-    loan_id = _create_loan(client, owner_id, amount=amount, rate=rate, term=term)
+    loan_id = make_loan(owner_id, amount=amount, rate=rate, term=term)
 
     r = client.get(f"/loans/{loan_id}/schedule")
     assert r.status_code == 200
-    schedule = r.json()
+    schedule = r.json(parse_float=Decimal)
 
     # Expected monthly payment to 2 decimals
     exp = list(_expected_amortization(amount, rate, term))
     expected_payment = exp[0][1]  # Decimal
-    schedule_payment = Decimal(str(schedule[0]["monthly_payment"]))
+    schedule_payment = schedule[0]["monthly_payment"]
     assert schedule_payment == expected_payment
 
     # Final remaining balance ~ 0
-    assert Decimal(str(schedule[-1]["remaining_balance"])) == Decimal("0.00")
+    assert schedule[-1]["remaining_balance"] == _ZERO_CENTS
 
 
 # Summary happy path: summary values match amortization at month 1/mid/term
 
-def test_summary_happy_path_matches_amortization(client: TestClient):
-    owner_id = _create_user(client, "sumhappy", "sumhappy@example.com")
+def test_summary_happy_path_matches_amortization(client: TestClient, make_user, make_loan):
+    owner_id = make_user("sumhappy", "sumhappy@example.com")
     amount = 12345.67
     rate = 4.25
     term = 24
-    loan_id = _create_loan(client, owner_id, amount=amount, rate=rate, term=term)
+    loan_id = make_loan(owner_id, amount=amount, rate=rate, term=term)
 
     amort = list(_expected_amortization(amount, rate, term))
+    # Running totals after each month, so every checked month is a lookup
+    cum_interest, cum_principal = _expected_running_totals(amount, rate, term)
 
     # Check month 1, mid-term, and final term
     for month in [1, term // 2, term]:
-        total_interest = sum(row[2] for row in amort[:month])  # Decimal
-        total_principal = sum(row[3] for row in amort[:month])  # Decimal
+        total_interest = cum_interest[month - 1]
+        total_principal = cum_principal[month - 1]
         remaining = amort[month - 1][4]  # Decimal
 
         r = client.get(f"/loans/{loan_id}/summary", params={"month": month})
         assert r.status_code == 200
-        data = r.json()
+        data = r.json(parse_float=Decimal)
 
-        cur_bal = Decimal(str(data["current_principal_balance"]))
-        tot_prin = Decimal(str(data["total_principal_paid"]))
-        tot_int = Decimal(str(data["total_interest_paid"]))
+        cur_bal = data["current_principal_balance"]
+        tot_prin = data["total_principal_paid"]
+        tot_int = data["total_interest_paid"]
 
         assert cur_bal == _to_cents(remaining)
         assert tot_prin == _to_cents(total_principal)
@@ -260,9 +424,9 @@ def test_summary_happy_path_matches_amortization(client: TestClient):
 
     # At term: all principal paid
     r_final = client.get(f"/loans/{loan_id}/summary", params={"month": term})
-    d_final = r_final.json()
-    assert Decimal(str(d_final["current_principal_balance"])) == Decimal("0.00")
-    assert Decimal(str(d_final["total_principal_paid"])) == _to_cents(Decimal(str(amount)))
+    d_final = r_final.json(parse_float=Decimal)
+    assert d_final["current_principal_balance"] == _ZERO_CENTS
+    assert d_final["total_principal_paid"] == _to_cents(Decimal(str(amount)))
 
 
 # Financial accuracy (parametrized): verify final totals at term match amortization results
@@ -271,30 +435,30 @@ def test_summary_happy_path_matches_amortization(client: TestClient):
     "amount, rate, term",
     [
         (10000.0, 6.0, 12),
-        (250000.0, 5.5, 360),
+        pytest.param(250000.0, 5.5, 360, marks=pytest.mark.slow),
         (5000.0, 0.99, 24),
         (9999.99, 9.99, 48),
     ],
 )
 
-def test_financial_accuracy_final_totals(client: TestClient, amount, rate, term):
-    owner_id = _create_user(client, f"fin_{amount}_{rate}_{term}", f"fin_{amount}_{rate}_{term}@example.com")
-    loan_id = _create_loan(client, owner_id, amount=amount, rate=rate, term=term)
+def test_financial_accuracy_final_totals(client: TestClient, make_user, make_loan, amount, rate, term):
+    owner_id = make_user(f"fin_{amount}_{rate}_{term}", f"fin_{amount}_{rate}_{term}@example.com")
+    loan_id = make_loan(owner_id, amount=amount, rate=rate, term=term)
 
     # Endpoint summary at term
     r = client.get(f"/loans/{loan_id}/summary", params={"month": term})
     assert r.status_code == 200
-    summary = r.json()
+    summary = r.json(parse_float=Decimal)
 
-    amort = list(_expected_amortization(amount, rate, term))
-    total_interest_expected = _to_cents(sum(row[2] for row in amort))  # Decimal
+    cum_interest, _ = _expected_running_totals(amount, rate, term)
+    total_interest_expected = _to_cents(cum_interest[-1])  # Decimal
     
     # Principal paid equals original principal
-    assert Decimal(str(summary["total_principal_paid"])) == _to_cents(Decimal(str(amount)))
+    assert summary["total_principal_paid"] == _to_cents(Decimal(str(amount)))
     # Remaining is zero
-    assert Decimal(str(summary["current_principal_balance"])) == Decimal("0.00")
+    assert summary["current_principal_balance"] == _ZERO_CENTS
     # Interest equals expected amortized interest
-    assert Decimal(str(summary["total_interest_paid"])) == total_interest_expected
+    assert summary["total_interest_paid"] == total_interest_expected
 
 
 # Payment consistency: sum of monthly payments equals principal + total interest (to the cent)
@@ -308,31 +472,108 @@ def test_financial_accuracy_final_totals(client: TestClient, amount, rate, term)
     ],
 )
 
-def test_financial_accuracy_payment_consistency(client: TestClient, amount, rate, term):
-    owner_id = _create_user(client, f"pay_{amount}_{rate}_{term}", f"pay_{amount}_{rate}_{term}@example.com")
-    loan_id = _create_loan(client, owner_id, amount=amount, rate=rate, term=term)
+def test_financial_accuracy_payment_consistency(client: TestClient, make_user, make_loan, amount, rate, term):
+    owner_id = make_user(f"pay_{amount}_{rate}_{term}", f"pay_{amount}_{rate}_{term}@example.com")
+    loan_id = make_loan(owner_id, amount=amount, rate=rate, term=term)
 
-    sched = client.get(f"/loans/{loan_id}/schedule").json()
-    payment = Decimal(str(sched[0]["monthly_payment"]))
+    sched = client.get(f"/loans/{loan_id}/schedule").json(parse_float=Decimal)
+    payment = sched[0]["monthly_payment"]
     total_paid = payment * Decimal(term)
 
-    final_summary = client.get(f"/loans/{loan_id}/summary", params={"month": term}).json()
-    expected_total = Decimal(str(amount)) + Decimal(str(final_summary["total_interest_paid"]))
+    final_summary = client.get(f"/loans/{loan_id}/summary", params={"month": term}).json(parse_float=Decimal)
+    expected_total = Decimal(str(amount)) + final_summary["total_interest_paid"]
     assert total_paid == expected_total
 
 
-# Identity check: for any month, total_principal_paid + current_principal_balance == original principal (to cents)
-
-def test_financial_identity_by_month(client: TestClient):
-    amount = Decimal("54321.0")
-    rate = 7.25
-    term = 36
-    owner_id = _create_user(client, "ident_user", "ident@example.com")
-    loan_id = _create_loan(client, owner_id, amount=float(amount), rate=rate, term=term)
-
-    for month in [0, 1, term // 3, term // 2, term]:
-        data = client.get(f"/loans/{loan_id}/summary", params={"month": month}).json()
-        # principal_paid + remaining == original principal (to cents)
-        total = Decimal(str(data["total_principal_paid"])) + Decimal(str(data["current_principal_balance"]))
-        assert total == _to_cents(amount)
+# Public helpers: amortization_state_at_month and the deprecated per-value wrappers
+# agree with the /summary endpoint, and the deprecation points at the public helper
 
+def test_summary_helpers_match_endpoint(client: TestClient, make_user, make_loan):
+    amount = 12345.67
+    rate = 4.25
+    term = 24
+    owner_id = make_user("helpers", "helpers@example.com")
+    loan_id = make_loan(owner_id, amount=amount, rate=rate, term=term)
+
+    P = Decimal(str(amount))
+    r = Decimal(str(rate)) / _HUNDRED / _TWELVE
+    for month in [0, 1, term // 2, term]:
+        data = client.get(f"/loans/{loan_id}/summary", params={"month": month}).json(parse_float=Decimal)
+        assert (
+            data["current_principal_balance"],
+            data["total_principal_paid"],
+            data["total_interest_paid"],
+        ) == amortization_state_at_month(P, r, term, month)
+        with pytest.deprecated_call(match="use amortization_state_at_month"):
+            assert data["current_principal_balance"] == current_principal_balance_at_month(P, r, term, month)
+        with pytest.deprecated_call(match="use amortization_state_at_month"):
+            assert data["total_principal_paid"] == total_principal_paid_at_month(P, r, term, month)
+        with pytest.deprecated_call(match="use amortization_state_at_month"):
+            assert data["total_interest_paid"] == total_interest_paid_at_month(P, r, term, month)
+
+
+# Databases created before loans.monthly_payment get the column and the newer
+# indexes at startup, and their rows are still served with the payment computed on read
+
+def _legacy_engine(tmp_path, loans):
+    """Return an engine on a database with the baseline schema holding `loans`.
+
+    Each loan is (id, amount, annual_interest_rate, loan_term_in_months), owned by user 1.
+    """
+    legacy_engine = create_engine(f"sqlite:///{tmp_path / 'legacy.sqlite3'}")
+    with legacy_engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, username VARCHAR NOT NULL UNIQUE, email VARCHAR NOT NULL UNIQUE)"
+        )
+        conn.exec_driver_sql(
+            "CREATE TABLE loans (id INTEGER PRIMARY KEY, amount FLOAT NOT NULL, annual_interest_rate FLOAT NOT NULL, "
+            "loan_term_in_months INTEGER NOT NULL, user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE)"
+        )
+        conn.exec_driver_sql(
+            "CREATE TABLE loan_shares (loan_id INTEGER NOT NULL, user_id INTEGER NOT NULL, PRIMARY KEY (loan_id, user_id))"
+        )
+        conn.exec_driver_sql("INSERT INTO users (id, username, email) VALUES (1, 'legacy', 'legacy@example.com')")
+        for loan in loans:
+            conn.exec_driver_sql(
+                "INSERT INTO loans (id, amount, annual_interest_rate, loan_term_in_months, user_id) VALUES (?, ?, ?, ?, 1)",
+                loan,
+            )
+    return legacy_engine
+
+
+def test_loan_created_before_monthly_payment_column(client: TestClient, tmp_path):
+    legacy_engine = _legacy_engine(tmp_path, [(1, 15000.0, 7.5, 36)])
+
+    _upgrade_existing_schema(legacy_engine)
+    _upgrade_existing_schema(legacy_engine)  # no-op once the database is current
+    legacy_inspector = inspect(legacy_engine)
+    assert "monthly_payment" in {c["name"] for c in legacy_inspector.get_columns("loans")}
+    assert "ix_loans_user_id" in {i["name"] for i in legacy_inspector.get_indexes("loans")}
+    assert "ix_loan_shares_user_id" in {i["name"] for i in legacy_inspector.get_indexes("loan_shares")}
+
+    with Session(legacy_engine) as legacy_session:
+        app.dependency_overrides[get_db] = lambda: legacy_session
+        schedule = client.get("/loans/1/schedule").json(parse_float=Decimal)
+        summary = client.get("/loans/1/summary", params={"month": 36}).json(parse_float=Decimal)
+    legacy_engine.dispose()
+
+    assert len(schedule) == 36
+    assert schedule[0]["monthly_payment"] == next(_expected_amortization(15000.0, 7.5, 36))[1]
+    assert summary["current_principal_balance"] == _ZERO_CENTS
+    assert summary["total_interest_paid"] == _to_cents(_expected_running_totals(15000.0, 7.5, 36)[0][-1])
+
+
+# Create-time input limits do not apply to reads: legacy rows outside them are still listed
+
+def test_legacy_loan_outside_input_limits_is_served(client: TestClient, tmp_path):
+    legacy_engine = _legacy_engine(tmp_path, [(1, 2500000000.0, 7.5, 36), (2, 15000.0, 7.5, 36)])
+    _upgrade_existing_schema(legacy_engine)
+
+    with Session(legacy_engine) as legacy_session:
+        app.dependency_overrides[get_db] = lambda: legacy_session
+        responses = [client.get(url) for url in ("/loans", "/loans/1", "/users/1/loans")]
+    legacy_engine.dispose()
+
+    assert [r.status_code for r in responses] == [200, 200, 200]
+    assert [loan["amount"] for loan in responses[0].json()] == [2500000000.0, 15000.0]
+    assert responses[1].json()["amount"] == 2500000000.0
@@ -21,3 +21,21 @@ def test_create_and_list_users(client: TestClient):
     assert len(users) == 2
     names = {u["username"] for u in users}
     assert names == {"alice", "bob"}
+
+
+def test_list_users_pagination(client: TestClient):
+    ids = []
+    for name in ["u1", "u2", "u3"]:
+        r = client.post("/users", json={"username": name, "email": f"{name}@example.com"})
+        assert r.status_code == 201, r.text
+        ids.append(r.json()["id"])
+
+    # First page, then the next page keyed on the last id seen
+    page1 = client.get("/users", params={"limit": 2}).json()
+    assert [u["id"] for u in page1] == ids[:2]
+    page2 = client.get("/users", params={"limit": 2, "after_id": page1[-1]["id"]}).json()
+    assert [u["id"] for u in page2] == ids[2:]
+
+    # Page size is bounded
+    assert client.get("/users", params={"limit": 0}).status_code == 422
+    assert client.get("/users", params={"limit": 1001}).status_code == 422